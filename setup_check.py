@@ -4,54 +4,89 @@ Setup and Configuration Check for ATS System
 Verifies installation and API key configuration
 """
 
+import http.client
+import importlib
+import importlib.util
+import io
 import os
+import socket
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlsplit
+
+
+_thread_output = threading.local()
+
+
+class _ThreadLocalStdout:
+    """Stdout proxy that sends each worker thread's prints to its own buffer"""
+    
+    def __init__(self, default):
+        self._default = default
+    
+    def _target(self):
+        return getattr(_thread_output, "buffer", self._default)
+    
+    def write(self, text):
+        return self._target().write(text)
+    
+    def flush(self):
+        self._target().flush()
+
+
+def _run_buffered(check):
+    """Run a check with its output captured; returns (result, captured_text)"""
+    
+    buffer = io.StringIO()
+    _thread_output.buffer = buffer
+    try:
+        result = check()
+    finally:
+        del _thread_output.buffer
+    return result, buffer.getvalue()
+
+
+# (import name, pip name, required?) — required packages first, in report order
+_PACKAGES = (
+    ('streamlit', 'streamlit', True),
+    ('pandas', 'pandas', True),
+    ('plotly', 'plotly', True),
+    ('PyPDF2', 'PyPDF2', True),
+    ('docx', 'python-docx', True),
+    ('sqlite3', 'sqlite3 (built-in)', True),
+    ('autogen', 'pyautogen', False),
+    ('openai', 'openai', False),
+    ('anthropic', 'anthropic', False),
+    ('pdfplumber', 'pdfplumber', False),
+    ('ahocorasick', 'pyahocorasick', False),
+    ('numba', 'numba', False),
+    ('orjson', 'orjson', False),
+    ('blake3', 'blake3', False),
+)
+
 
 def check_dependencies():
     """Check if required packages are installed"""
     
     print("🔍 Checking Dependencies...")
     
-    required_packages = [
-        ('streamlit', 'streamlit'),
-        ('pandas', 'pandas'),
-        ('plotly', 'plotly'),
-        ('PyPDF2', 'PyPDF2'),
-        ('docx', 'python-docx'),
-        ('sqlite3', 'sqlite3 (built-in)'),
-    ]
+    # find_spec locates each module without executing it
+    results = [(package, pip_name, required, importlib.util.find_spec(package) is not None)
+               for package, pip_name, required in _PACKAGES]
     
-    optional_packages = [
-        ('autogen', 'pyautogen'),
-        ('openai', 'openai'),
-        ('anthropic', 'anthropic'),
-        ('pdfplumber', 'pdfplumber'),
-    ]
+    for package, _, required, installed in results:
+        if installed:
+            print(f"  ✅ {package}" if required else f"  ✅ {package} (optional)")
+        else:
+            print(f"  ❌ {package} (required)" if required else f"  ⚠️  {package} (optional)")
     
-    missing_required = []
-    missing_optional = []
-    
-    # Check required packages
-    for package, pip_name in required_packages:
-        try:
-            if package == 'sqlite3':
-                import sqlite3
-            else:
-                __import__(package)
-            print(f"  ✅ {package}")
-        except ImportError:
-            missing_required.append(pip_name)
-            print(f"  ❌ {package} (required)")
-    
-    # Check optional packages
-    for package, pip_name in optional_packages:
-        try:
-            __import__(package)
-            print(f"  ✅ {package} (optional)")
-        except ImportError:
-            missing_optional.append(pip_name)
-            print(f"  ⚠️  {package} (optional)")
+    missing_required = [pip_name for _, pip_name, required, installed in results
+                        if required and not installed]
+    missing_optional = [pip_name for _, pip_name, required, installed in results
+                        if not required and not installed]
     
     if missing_required:
         print(f"\n❌ Missing required packages: {', '.join(missing_required)}")
@@ -65,25 +100,48 @@ def check_dependencies():
     return True
 
 
+# Path probes are memoized for the lifetime of this short-running script
+@lru_cache(maxsize=None)
+def _exists(path: str) -> bool:
+    """Cached os.path.exists"""
+    return os.path.exists(path)
+
+
+def _ollama_available(base_url: str, timeout: float = 0.3) -> bool:
+    """Check whether an Ollama server answers /api/tags at base_url"""
+    
+    try:
+        parts = urlsplit(base_url)
+        secure = parts.scheme == "https"
+        host = parts.hostname or "localhost"
+        port = parts.port or (443 if secure else 11434)
+    except ValueError:
+        # Malformed URL (e.g. a non-numeric port) means no reachable server
+        return False
+    
+    # Cheap TCP connect first; a refused localhost port fails immediately
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+    except OSError:
+        return False
+    
+    connection_class = http.client.HTTPSConnection if secure else http.client.HTTPConnection
+    conn = connection_class(host, port, timeout=timeout)
+    try:
+        # Keep any path prefix, e.g. Ollama served behind a reverse proxy
+        conn.request("GET", parts.path.rstrip("/") + "/api/tags")
+        return conn.getresponse().status == 200
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
+
+
 def check_api_configuration():
     """Check API key configuration"""
     
     print("\n🔑 Checking API Configuration...")
     
-    # Check for .env file
-    env_file = Path('.env')
-    if env_file.exists():
-        print("  ✅ .env file found")
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-            print("  ✅ .env file loaded")
-        except ImportError:
-            print("  ⚠️  python-dotenv not installed (install for .env support)")
-    else:
-        print("  ⚠️  .env file not found (will use environment variables)")
-    
-    # Check API keys
     api_keys = {
         'OpenAI': 'OPENAI_API_KEY',
         'Anthropic': 'ANTHROPIC_API_KEY',
@@ -91,23 +149,39 @@ def check_api_configuration():
         'Google': 'GOOGLE_API_KEY'
     }
     
-    found_keys = []
-    for provider, env_var in api_keys.items():
-        if os.getenv(env_var):
-            found_keys.append(provider)
+    # Check for .env file
+    env_file = Path('.env')
+    if _exists(str(env_file)):
+        print("  ✅ .env file found")
+        # load_dotenv never overrides existing variables, so it can only add something
+        # when an API key or OLLAMA_BASE_URL is still unset
+        if all(os.environ.get(env_var) for env_var in (*api_keys.values(), 'OLLAMA_BASE_URL')):
+            print("  ✅ .env file skipped (all settings already in environment)")
+        else:
+            try:
+                from dotenv import load_dotenv
+                load_dotenv(dotenv_path=env_file)
+                print("  ✅ .env file loaded")
+            except ImportError:
+                print("  ⚠️  python-dotenv not installed (install for .env support)")
+    else:
+        print("  ⚠️  .env file not found (will use environment variables)")
+    
+    # Check API keys
+    environ = os.environ
+    found_keys = [provider for provider, env_var in api_keys.items() if environ.get(env_var)]
+    for provider in api_keys:
+        if provider in found_keys:
             print(f"  ✅ {provider} API key configured")
         else:
             print(f"  ⚪ {provider} API key not found")
     
     # Check Ollama
     ollama_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
-    try:
-        import requests
-        response = requests.get(f"{ollama_url}/api/tags", timeout=2)
-        if response.status_code == 200:
-            found_keys.append("Ollama (Local)")
-            print(f"  ✅ Ollama local LLM available at {ollama_url}")
-    except:
+    if _ollama_available(ollama_url):
+        found_keys.append("Ollama (Local)")
+        print(f"  ✅ Ollama local LLM available at {ollama_url}")
+    else:
         print(f"  ⚪ Ollama not available at {ollama_url}")
     
     if found_keys:
@@ -118,6 +192,17 @@ def check_api_configuration():
         return "python"
 
 
+@lru_cache(maxsize=None)
+def _list_subdirs(parent: str) -> frozenset:
+    """Return the names of directories directly under parent (empty if missing)"""
+    
+    try:
+        with os.scandir(parent) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
 def check_file_structure():
     """Check if required directories exist"""
     
@@ -132,9 +217,17 @@ def check_file_structure():
         'tests'
     ]
     
+    # One directory listing per parent instead of one stat per path
+    subdirs_by_parent = {}
+    for dir_path in required_dirs:
+        parent = os.path.dirname(dir_path) or '.'
+        if parent not in subdirs_by_parent:
+            subdirs_by_parent[parent] = _list_subdirs(parent)
+    
     missing_dirs = []
     for dir_path in required_dirs:
-        if Path(dir_path).exists():
+        parent = os.path.dirname(dir_path) or '.'
+        if os.path.basename(dir_path) in subdirs_by_parent[parent]:
             print(f"  ✅ {dir_path}/")
         else:
             missing_dirs.append(dir_path)
@@ -148,51 +241,109 @@ def check_file_structure():
     return True
 
 
+def _test_config():
+    """Test configuration loading"""
+    
+    config_module = importlib.import_module("utils.config")
+    
+    config = config_module.get_config()
+    print(f"  ✅ Configuration loaded")
+    print(f"  📊 LLM Enabled: {config_module.is_llm_enabled()}")
+    print(f"  🗄️  Database: {config.database_config.url}")
+
+
+def _test_resume_processor():
+    """Test resume processor initialization"""
+    
+    autogen_config = importlib.import_module("utils.config").get_autogen_config()
+    if autogen_config:
+        config_list = [autogen_config]
+        processor = importlib.import_module("agents.resume_processor").ResumeProcessingAgent(config_list)
+        print(f"  ✅ Resume processor initialized")
+    else:
+        print(f"  ⚠️  Resume processor: No LLM config (would use fallback)")
+
+
+def _test_database():
+    """Test database operations"""
+    
+    import sqlite3
+    
+    db_path = "ats_system.db"  # Use actual database file
+    if not _exists(db_path):
+        print(f"  ⚠️  Database: {db_path} not created yet (initialized on first app run)")
+        return
+    
+    # Read-only probe: no write transaction, no junk session rows
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        conn.execute("PRAGMA schema_version").fetchone()
+    finally:
+        conn.close()
+    print(f"  ✅ Database operations working")
+
+
+def _test_visualization():
+    """Test visualization agent"""
+    
+    viz = importlib.import_module("agents.visualization_agent").VisualizationAgent()
+    print(f"  ✅ Visualization agent working")
+
+
 def test_system_functionality():
     """Test basic system functionality"""
     
     print("\n🧪 Testing System Functionality...")
     
-    try:
-        # Test configuration loading
-        sys.path.append('src')
-        from utils.config import get_config, is_llm_enabled
-        
-        config = get_config()
-        print(f"  ✅ Configuration loaded")
-        print(f"  📊 LLM Enabled: {is_llm_enabled()}")
-        print(f"  🗄️  Database: {config.database_config.url}")
-        
-        # Test resume processing
-        from agents.resume_processor import ResumeProcessingAgent
-        from utils.config import get_autogen_config
-        
-        autogen_config = get_autogen_config()
-        if autogen_config:
-            config_list = [autogen_config]
-            processor = ResumeProcessingAgent(config_list)
-            print(f"  ✅ Resume processor initialized")
-        else:
-            print(f"  ⚠️  Resume processor: No LLM config (would use fallback)")
-        
-        # Test database
-        from database.operations import DatabaseManager
-        
-        db = DatabaseManager("ats_system.db")  # Use actual database file
-        session_id = db.create_session()
-        print(f"  ✅ Database operations working")
-        
-        # Test visualization
-        from agents.visualization_agent import VisualizationAgent
-        
-        viz = VisualizationAgent()
-        print(f"  ✅ Visualization agent working")
-        
-        return True
-        
-    except Exception as e:
-        print(f"  ❌ System test failed: {e}")
-        return False
+    # Front of the path so project packages resolve before site-packages
+    if 'src' not in sys.path:
+        sys.path.insert(0, 'src')
+    
+    # Each component imports its own modules, so one failure doesn't skip the rest
+    system_tests = [
+        ("Configuration", _test_config),
+        ("Resume processor", _test_resume_processor),
+        ("Database", _test_database),
+        ("Visualization", _test_visualization),
+    ]
+    
+    all_ok = True
+    for name, test in system_tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"  ❌ {name} test failed: {e}")
+            all_ok = False
+    
+    return all_ok
+
+
+# (result key, line when the check passed, line when it failed); None prints nothing
+SUMMARY_LINES = (
+    ("deps", "✅ Dependencies: All required packages installed",
+             "❌ Dependencies: Missing required packages"),
+    ("api", "🔑 API Mode: LLM", "🔑 API Mode: PYTHON"),
+    ("structure", "✅ File Structure: All directories present",
+                  "❌ File Structure: Missing directories"),
+    ("system", "✅ System Test: All components working",
+               "❌ System Test: Some components failed"),
+)
+
+NEXT_STEP_LINES = (
+    ("deps", None, "1. Install missing packages: pip install -r requirements.txt"),
+    ("api", None, "2. [Optional] Add API key to .env for LLM features"),
+    ("system", "3. Run the application: streamlit run streamlit_app/app.py",
+               "3. Fix system errors before running the application"),
+)
+
+
+def _print_report(lines, results):
+    """Print the pass or fail line of each table entry"""
+    
+    for key, ok_line, fail_line in lines:
+        line = ok_line if results[key] else fail_line
+        if line is not None:
+            print(line)
 
 
 def main():
@@ -202,56 +353,48 @@ def main():
     print("=" * 50)
     
     # Change to script directory
-    script_dir = Path(__file__).parent
-    if script_dir != Path.cwd():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if os.getcwd() != script_dir:
         os.chdir(script_dir)
         print(f"📁 Working directory: {script_dir}")
     
-    # Run checks
-    deps_ok = check_dependencies()
-    api_mode = check_api_configuration()
-    structure_ok = check_file_structure()
+    # Run the independent checks concurrently; output is replayed in a fixed order
+    original_stdout = sys.stdout
+    sys.stdout = _ThreadLocalStdout(original_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            fut_deps = executor.submit(_run_buffered, check_dependencies)
+            fut_api = executor.submit(_run_buffered, check_api_configuration)
+            fut_struct = executor.submit(_run_buffered, check_file_structure)
+            (deps_ok, deps_out), (api_mode, api_out), (structure_ok, struct_out) = (
+                fut_deps.result(), fut_api.result(), fut_struct.result()
+            )
+    finally:
+        sys.stdout = original_stdout
+    
+    print(deps_out + api_out + struct_out, end="")
     
     if deps_ok and structure_ok:
         system_ok = test_system_functionality()
     else:
         system_ok = False
     
+    results = {
+        "deps": deps_ok,
+        "api": api_mode == "llm",
+        "structure": structure_ok,
+        "system": system_ok,
+    }
+    
     # Summary
     print("\n" + "=" * 50)
     print("📋 Setup Summary")
     print("=" * 50)
-    
-    if deps_ok:
-        print("✅ Dependencies: All required packages installed")
-    else:
-        print("❌ Dependencies: Missing required packages")
-    
-    print(f"🔑 API Mode: {api_mode.upper()}")
-    
-    if structure_ok:
-        print("✅ File Structure: All directories present")
-    else:
-        print("❌ File Structure: Missing directories")
-    
-    if system_ok:
-        print("✅ System Test: All components working")
-    else:
-        print("❌ System Test: Some components failed")
+    _print_report(SUMMARY_LINES, results)
     
     # Final recommendations
     print("\n🎯 Next Steps:")
-    
-    if not deps_ok:
-        print("1. Install missing packages: pip install -r requirements.txt")
-    
-    if api_mode == "python":
-        print("2. [Optional] Add API key to .env for LLM features")
-    
-    if system_ok:
-        print("3. Run the application: streamlit run streamlit_app/app.py")
-    else:
-        print("3. Fix system errors before running the application")
+    _print_report(NEXT_STEP_LINES, results)
     
     print("\n📚 Documentation:")
     print("- README.md: Complete setup and usage guide")
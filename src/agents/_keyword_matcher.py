@@ -0,0 +1,49 @@
+"""
+Substring keyword matching shared by the ATS agents
+Single-pass Aho-Corasick scan when pyahocorasick is installed, plain `in` checks otherwise
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+# Optional multi-pattern matcher for keyword scanning
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+@lru_cache(maxsize=256)
+def _build_keyword_automaton(keywords: Tuple[str, ...]):
+    """Compile a keyword set into an Aho-Corasick automaton (cached per keyword set)"""
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+class KeywordMatcher:
+    """A fixed keyword set compiled once; find() reports which keywords occur in a text"""
+    
+    __slots__ = ("keywords", "_empty", "_automaton")
+    
+    def __init__(self, keywords):
+        self.keywords = frozenset(keywords)
+        self._empty = frozenset(keyword for keyword in self.keywords if not keyword)  # "" is in any string
+        non_empty = tuple(sorted(keyword for keyword in self.keywords if keyword))
+        self._automaton = (_build_keyword_automaton(non_empty)
+                           if AHOCORASICK_AVAILABLE and non_empty else None)
+    
+    def find(self, text: str) -> set:
+        """Return the keywords that occur as substrings of text, in a single pass when possible"""
+        
+        if not AHOCORASICK_AVAILABLE:
+            return {keyword for keyword in self.keywords if keyword in text}
+        
+        found = set(self._empty)
+        if self._automaton is not None:
+            found.update(keyword for _, keyword in self._automaton.iter(text))
+        return found
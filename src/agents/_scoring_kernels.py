@@ -0,0 +1,117 @@
+"""
+Numeric scoring kernels for the ATS scorer
+JIT-compiled with numba when it is installed, plain Python otherwise
+"""
+
+import threading
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+# Optional JIT for numeric scoring kernels; without numba they run as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Title seniority codes used by the experience kernel
+SENIORITY_SENIOR = 1
+SENIORITY_STANDARD = 0
+SENIORITY_JUNIOR = -1
+
+
+@njit(cache=True)
+def score_experience_kernel(durations, responsibility_counts, has_achievements,
+                            has_quantified, seniority, relevance_matches):
+    """Weighted experience score over pre-extracted per-entry features; returns (total, weights_sum)"""
+    
+    total_score = 0.0
+    weights_sum = 0.0
+    
+    for i in range(len(durations)):
+        exp_score = 0.0
+        weight = 1.0
+        
+        # Score based on duration
+        if durations[i] >= 3:
+            exp_score += 30  # Long-term experience bonus
+        elif durations[i] >= 1:
+            exp_score += 20
+        else:
+            exp_score += 10
+        
+        # Score based on responsibilities
+        if responsibility_counts[i] >= 5:
+            exp_score += 25
+        elif responsibility_counts[i] >= 3:
+            exp_score += 20
+        else:
+            exp_score += 10
+        
+        # Score based on achievements, with a bonus for quantified ones
+        if has_achievements[i]:
+            exp_score += 25
+            if has_quantified[i]:
+                exp_score += 15
+        
+        # Score based on title seniority
+        if seniority[i] == SENIORITY_SENIOR:
+            exp_score += 20
+            weight = 1.5  # Higher weight for senior roles
+        elif seniority[i] == SENIORITY_JUNIOR:
+            weight = 0.8
+        
+        # Job relevance if requirements provided
+        if relevance_matches[i] > 0:
+            exp_score += relevance_matches[i] * 10
+        
+        total_score += exp_score * weight
+        weights_sum += weight
+    
+    return total_score, weights_sum
+
+
+@njit(cache=True)
+def weighted_row_sums(scores, weights):
+    """Weighted sum of each row of an (N, K) score matrix, adding the columns in order"""
+    
+    totals = np.empty(scores.shape[0])
+    
+    for i in range(scores.shape[0]):
+        total = 0.0
+        for j in range(scores.shape[1]):
+            total += scores[i, j] * weights[j]
+        totals[i] = total
+    
+    return totals
+
+
+@lru_cache(maxsize=None)
+def warm_up_kernels() -> None:
+    """Compile the kernels once per process so the first real score isn't slow"""
+    
+    if NUMBA_AVAILABLE:
+        score_experience_kernel(np.zeros(1, dtype=np.float64), np.zeros(1, dtype=np.int64),
+                                np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int8),
+                                np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int64))
+        weighted_row_sums(np.zeros((1, 5), dtype=np.float64), np.zeros(5, dtype=np.float64))
+
+
+@lru_cache(maxsize=None)
+def start_kernel_warm_up() -> Optional[threading.Thread]:
+    """Compile the kernels on a background thread; returns None when numba is missing"""
+    
+    if not NUMBA_AVAILABLE:
+        return None
+    thread = threading.Thread(target=warm_up_kernels, name="scoring-kernel-warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -4,26 +4,197 @@ Provides actionable feedback and enhancement suggestions
 """
 
 import autogen
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Final, Iterator, List, Any, Optional, Tuple
+import bisect
+import copy
 import json
+import hashlib
+import os
+import sys
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from datetime import datetime
 import re
 
+try:
+    from ._keyword_matcher import KeywordMatcher
+except ImportError:  # run as a script: python src/agents/improvement_agent.py
+    from _keyword_matcher import KeywordMatcher
 
-class ImprovementRecommendationAgent:
-    """
-    AutoGen agent for generating specific improvement recommendations
-    """
+# Optional fast JSON encoder for cache keys; stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Date and email checks, compiled once at import
+_DATE_RE = re.compile(r'\d{2}/\d{4}')          # strict MM/YYYY (format enhancements)
+_DATE_LOOSE_RE = re.compile(r'\d{1,2}/\d{4}')  # M/YYYY or MM/YYYY (quick wins)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Weak phrases flagged in responsibility bullets; before/after examples skip "assisted"
+_WEAK_PHRASES = ("responsible for", "helped", "worked on", "assisted")
+_WEAK_EXAMPLE_PHRASES = ("responsible for", "helped", "worked on")
+
+# Improvement potential ladder: below 50 high (30), 50+ medium (20), 70+ low (10), 85+ minimal (5)
+_POTENTIAL_THRESHOLDS = (50, 70, 85)
+_POTENTIAL_POINTS = (30, 20, 10, 5)
+
+# Long-term strategy text; each recommendations dict gets its own list copies.
+# Experience building ladder: under 2 years, 2+ years, 5+ years
+_EXPERIENCE_THRESHOLDS = (2, 5)
+_EXPERIENCE_BUILDING = (
+    (
+        "Focus on building foundational experience in core technologies",
+        "Seek mentorship opportunities with senior developers",
+        "Contribute to open-source projects to build portfolio",
+        "Consider internships or entry-level positions for experience",
+    ),
+    (
+        "Take on leadership roles in projects",
+        "Develop expertise in specific technology domains",
+        "Start mentoring junior team members",
+        "Pursue complex technical challenges and solutions",
+    ),
+    (
+        "Focus on strategic technical leadership",
+        "Drive architectural decisions and technology adoption",
+        "Build cross-functional collaboration skills",
+        "Consider management or technical lead opportunities",
+    ),
+)
+
+_INDUSTRY_POSITIONING = {
+    "technology": (
+        "Stay current with emerging technology trends",
+        "Build expertise in cloud technologies and DevOps",
+        "Develop understanding of AI/ML applications",
+        "Focus on scalable system design and architecture",
+    ),
+    "finance": (
+        "Understand financial domain and regulatory requirements",
+        "Develop expertise in security and compliance",
+        "Learn about fintech trends and blockchain technology",
+        "Focus on high-performance, reliable system development",
+    ),
+}
+
+_NETWORKING_RECOMMENDATIONS = (
+    "Join professional associations in your field",
+    "Attend industry conferences and meetups",
+    "Engage actively on LinkedIn with industry content",
+    "Build relationships with colleagues and industry peers",
+    "Consider speaking at conferences or writing technical blogs",
+)
+
+
+def _lowered_bullets(bullets: List[str]) -> str:
+    """Lowercase a role's bullets as one buffer so each phrase is searched once per role"""
     
-    def __init__(self, config_list: List[Dict[str, Any]]):
-        self.config_list = config_list
-        self.recommendation_history = []
-        
-        # Create the AutoGen agent
-        self.agent = autogen.AssistantAgent(
-            name="Improvement_Recommendation_Agent",
-            llm_config={"config_list": config_list},
-            system_message="""You are an expert Improvement Recommendation Agent specializing in:
+    # The phrases contain no newline, so a match never spans two bullets
+    return "\n".join(bullets).lower()
+
+
+@lru_cache(maxsize=256)
+def _lowered_skills(skills: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercase a job's skill or keyword list once; every resume checked against that job reuses it"""
+    
+    return tuple(skill.lower() for skill in skills)
+
+
+def _key_bytes(obj: Any) -> bytes:
+    """Key-sorted JSON bytes of obj for cache keys (unknown types are stringified)"""
+    
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS)
+        except TypeError:  # orjson.JSONEncodeError: non-str keys, huge ints
+            pass
+    return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+def _pretty_json(obj: Any) -> str:
+    """Two-space indented JSON of obj for display"""
+    
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:  # orjson.JSONEncodeError: non-str keys, huge ints
+            pass
+    return json.dumps(obj, indent=2)
+
+
+# Priority-1 action for the lowest scoring category (when it is below 60)
+_LOWEST_CATEGORY_ACTIONS = {
+    "skills_match": {
+        "category": "Skills Enhancement",
+        "action": "Add missing technical skills",
+        "description": "Your skills section needs immediate attention. Add 3-5 relevant technical skills that match job requirements.",
+        "impact": "High",
+        "effort": "Low",
+        "timeline": "1-2 hours"
+    },
+    "experience_relevance": {
+        "category": "Experience Enhancement",
+        "action": "Quantify achievements",
+        "description": "Add numbers, percentages, or metrics to your accomplishments. Use action verbs and specific results.",
+        "impact": "High",
+        "effort": "Medium",
+        "timeline": "3-4 hours"
+    },
+    "format_structure": {
+        "category": "Format Improvement",
+        "action": "Restructure resume sections",
+        "description": "Improve resume organization with clear headers, consistent formatting, and proper section order.",
+        "impact": "Medium",
+        "effort": "Medium",
+        "timeline": "2-3 hours"
+    },
+}
+
+# Priority-2 action when the scorer reports a missing LinkedIn URL
+_LINKEDIN_ACTION = {
+    "category": "Contact Information",
+    "action": "Add LinkedIn profile",
+    "description": "Include your LinkedIn profile URL in the contact section.",
+    "impact": "Medium",
+    "effort": "Low",
+    "timeline": "15 minutes"
+}
+
+
+# Slotted dataclasses (no per-instance __dict__) where supported; slots= needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ExperienceScan:
+    """Every experience signal the helpers need, computed in one pass over the entries"""
+    entry_count: int
+    content_issues: List[str]             # per-role experience_section messages, in order
+    missing_achievements: bool            # some role lists no achievements
+    nonstandard_dates: bool               # some start date doesn't start with MM/YYYY
+    unrecognized_dates: bool              # some start date doesn't start with M/YYYY or MM/YYYY
+    weak_example_bullet: Optional[str]    # first bullet worth a before/after rewrite
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class RecommendationLogEntry:
+    """One recommendation_history record"""
+    timestamp: str
+    initial_score: float
+    recommendation_count: int
+    weakest_areas: Tuple[str, ...]
+    has_job_requirements: bool
+
+
+# System prompt for the (lazily created) AutoGen recommendation assistant; one
+# string shared by every instance
+_SYSTEM_MESSAGE: Final[str] = """You are an expert Improvement Recommendation Agent specializing in:
             
             1. ACTIONABLE FEEDBACK:
             - Provide specific, implementable suggestions
@@ -51,6 +222,41 @@ class ImprovementRecommendationAgent:
             
             Focus on practical, immediately actionable advice that candidates
             can implement to improve their ATS scores and overall resume effectiveness."""
+
+# Fixed AutoGen cache seed, so replies to identical prompts come from AutoGen's response cache
+_LLM_CACHE_SEED: Final[int] = 42
+
+
+class ImprovementRecommendationAgent:
+    """
+    AutoGen agent for generating specific improvement recommendations
+    """
+    
+    _CACHE_SIZE = 1024
+    _HISTORY_SIZE = 10_000  # generations kept for statistics; older entries are dropped
+    
+    def __init__(self, config_list: List[Dict[str, Any]]):
+        self.config_list = config_list
+        self.recommendation_history = deque(maxlen=self._HISTORY_SIZE)
+        # Running totals and weak-area counts over recommendation_history, kept in step
+        # by _log_recommendation_generation
+        self._score_sum = 0.0
+        self._recommendation_count_sum = 0
+        self._job_targeted_count = 0
+        self._weak_area_counter = Counter()
+        self.recommendation_cache = OrderedDict()
+        self._job_fit_cache = OrderedDict()
+        self._resume_text_cache = OrderedDict()
+        self._pass_skills = None  # (resume_data, lowered skill set) for the pass in progress
+    
+    @cached_property
+    def agent(self):
+        """AutoGen assistant, created on first use; the rule-based recommendations never need it"""
+        
+        return autogen.AssistantAgent(
+            name="Improvement_Recommendation_Agent",
+            llm_config={"cache_seed": _LLM_CACHE_SEED, "config_list": self.config_list},
+            system_message=_SYSTEM_MESSAGE
         )
     
     def generate_improvements(self, resume_data: Dict[str, Any], 
@@ -65,9 +271,227 @@ class ImprovementRecommendationAgent:
             job_requirements: Job requirements for targeted recommendations
             
         Returns:
-            Comprehensive improvement recommendations
+            Comprehensive improvement recommendations (repeated identical
+            requests get a fresh copy of the cached result)
         """
         
+        input_digest = self._generate_input_digest(resume_data, job_requirements)
+        return self._generate_improvements(resume_data, scoring_result, job_requirements, input_digest)
+    
+    def generate_improvements_batch(self, resumes: List[Dict[str, Any]],
+                                    scoring_results: List[Any],
+                                    job_requirements: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Generate recommendations for many resumes against the same job
+        
+        Args:
+            resumes: Processed resume data, one per candidate
+            scoring_results: ATS scoring results, aligned with resumes
+            job_requirements: Job requirements shared by every resume
+            
+        Returns:
+            One recommendations dict per resume, in input order
+        """
+        
+        if len(resumes) != len(scoring_results):
+            raise ValueError("resumes and scoring_results must have the same length")
+        
+        # The job requirements are serialized and hashed once for the whole batch
+        job_hasher = self._job_hasher(job_requirements)
+        return [
+            self._generate_improvements(
+                resume_data, scoring_result, job_requirements,
+                self._generate_input_digest(resume_data, job_hasher=job_hasher)
+            )
+            for resume_data, scoring_result in zip(resumes, scoring_results)
+        ]
+    
+    def generate_improvements_many(self, resumes: List[Dict[str, Any]],
+                                   scoring_results: List[Any],
+                                   job_requirements: Dict[str, Any] = None,
+                                   workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Generate recommendations for many resumes against the same job in a process pool
+        
+        The job requirements are sent to each worker once (pool initializer); only
+        the resume and its scoring result are shipped per task. Small batches or
+        workers=1 fall back to in-process generate_improvements_batch.
+        
+        Args:
+            resumes: Processed resume data, one per candidate
+            scoring_results: ATS scoring results, aligned with resumes
+            job_requirements: Job requirements shared by every resume
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            One recommendations dict per resume, in input order
+        """
+        
+        if len(resumes) != len(scoring_results):
+            raise ValueError("resumes and scoring_results must have the same length")
+        
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(resumes) < 2:
+            return self.generate_improvements_batch(resumes, scoring_results, job_requirements)
+        
+        # The job requirements are serialized and hashed once for the whole batch
+        job_hasher = self._job_hasher(job_requirements)
+        cache_keys = [
+            self._generate_cache_key(
+                self._generate_input_digest(resume_data, job_hasher=job_hasher), scoring_result
+            )
+            for resume_data, scoring_result in zip(resumes, scoring_results)
+        ]
+        
+        # Reuse cached recommendations; send each distinct new request to the pool once
+        results_by_key = {}
+        pending = {}
+        for index, cache_key in enumerate(cache_keys):
+            if cache_key in results_by_key or cache_key in pending:
+                continue
+            cached_recommendations = self._get_cached_recommendations(cache_key)
+            if cached_recommendations is not None:
+                results_by_key[cache_key] = cached_recommendations
+            else:
+                pending[cache_key] = index
+        
+        generated_by_index = {}
+        
+        if pending:
+            pending_resumes = [resumes[index] for index in pending.values()]
+            pending_results = [scoring_results[index] for index in pending.values()]
+            workers = min(workers, len(pending_resumes))
+            chunksize = max(1, len(pending_resumes) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init,
+                                     initargs=(job_requirements,)) as executor:
+                generated = list(executor.map(_worker_improve, pending_resumes, pending_results,
+                                              chunksize=chunksize))
+            
+            # Workers have their own caches; record results here as in-process generation would
+            for (cache_key, index), recommendations in zip(pending.items(), generated):
+                generated_by_index[index] = recommendations
+                results_by_key[cache_key] = self._remember_recommendations(
+                    resumes[index], scoring_results[index], cache_key, recommendations
+                )
+        
+        # Every other position (cache hits and repeats within the batch) gets its own copy,
+        # logged like a generate_improvements call
+        return [
+            generated_by_index[index] if index in generated_by_index
+            else self._serve_cached_recommendations(resumes[index], scoring_results[index],
+                                                    results_by_key[cache_key])
+            for index, cache_key in enumerate(cache_keys)
+        ]
+    
+    def generate_improvements_iter(self, resume_data: Dict[str, Any],
+                                   scoring_result: Any,
+                                   job_requirements: Dict[str, Any] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Generate improvement recommendations one section at a time
+        
+        Args:
+            resume_data: Processed resume data
+            scoring_result: ATS scoring results
+            job_requirements: Job requirements for targeted recommendations
+            
+        Yields:
+            (section_name, payload) pairs in generate_improvements key order, "metadata"
+            last; a fully consumed iterator is logged and cached like generate_improvements
+        """
+        
+        input_digest = self._generate_input_digest(resume_data, job_requirements)
+        cache_key = self._generate_cache_key(input_digest, scoring_result)
+        cached_recommendations = self._get_cached_recommendations(cache_key)
+        if cached_recommendations is not None:
+            yield from self._serve_cached_recommendations(
+                resume_data, scoring_result, cached_recommendations
+            ).items()
+            return
+        
+        recommendations = {}
+        recommendation_count = 0
+        for section_name, payload, count in self._iter_sections(resume_data, scoring_result,
+                                                                job_requirements, input_digest):
+            recommendations[section_name] = payload
+            recommendation_count += count
+            yield section_name, payload
+        
+        self._finalize_recommendations(resume_data, scoring_result, job_requirements,
+                                       cache_key, recommendations, recommendation_count)
+        yield "metadata", recommendations["metadata"]
+    
+    def _generate_improvements(self, resume_data: Dict[str, Any], scoring_result: Any,
+                               job_requirements: Dict[str, Any], input_digest: str) -> Dict[str, Any]:
+        """Recommendation pipeline for one resume, given its precomputed input digest"""
+        
+        # Recommendations are a pure function of the inputs: serve exact repeats from the cache
+        cache_key = self._generate_cache_key(input_digest, scoring_result)
+        cached_recommendations = self._get_cached_recommendations(cache_key)
+        if cached_recommendations is not None:
+            return self._serve_cached_recommendations(resume_data, scoring_result,
+                                                      cached_recommendations)
+        
+        recommendations = {}
+        recommendation_count = 0
+        for section_name, payload, count in self._iter_sections(resume_data, scoring_result,
+                                                                job_requirements, input_digest):
+            recommendations[section_name] = payload
+            recommendation_count += count
+        return self._finalize_recommendations(resume_data, scoring_result, job_requirements,
+                                              cache_key, recommendations, recommendation_count)
+    
+    def _iter_sections(self, resume_data: Dict[str, Any], scoring_result: Any,
+                       job_requirements: Dict[str, Any], input_digest: str) -> Iterator[Tuple[str, Any, int]]:
+        """Produce the nine recommendation sections in order as (name, payload, count)"""
+        
+        # The lowered skill set is read by several sections; remember it for this pass
+        self._pass_skills = (resume_data, self._lowered_skill_set(resume_data))
+        try:
+            # Every experience-based helper reads the same single-pass scan
+            experience = self._scan_experience(resume_data)
+            
+            # Keyword and skill-gap advice ignores the scores, so it is cached per (resume, job)
+            keyword_recommendations, skill_recommendations = self._get_job_fit_recommendations(
+                input_digest, resume_data, job_requirements
+            )
+            
+            # Generate different types of recommendations. Each count is the section's share of
+            # recommendation_count: list sections count per item, dict sections (whose fixed
+            # keys are always present) count once.
+            priority_actions = self._generate_priority_actions(
+                resume_data, scoring_result, job_requirements
+            )
+            yield "priority_actions", priority_actions, len(priority_actions)
+            yield "content_improvements", self._generate_content_improvements(
+                resume_data, scoring_result, experience, job_requirements
+            ), 1
+            format_enhancements = self._generate_format_enhancements(
+                resume_data, scoring_result, experience
+            )
+            yield "format_enhancements", format_enhancements, len(format_enhancements)
+            yield "keyword_optimization", keyword_recommendations, 1
+            yield "skill_development", skill_recommendations, 1
+            yield "section_specific", self._generate_section_specific_recommendations(
+                resume_data, scoring_result, experience
+            ), 1
+            before_after_examples = self._generate_before_after_examples(
+                resume_data, scoring_result, experience
+            )
+            yield "before_after_examples", before_after_examples, len(before_after_examples)
+            quick_wins = self._generate_quick_wins(resume_data, scoring_result, experience)
+            yield "quick_wins", quick_wins, len(quick_wins)
+            yield "long_term_strategy", self._generate_long_term_strategy(
+                resume_data, job_requirements
+            ), 1
+        finally:
+            self._pass_skills = None
+    
+    def _finalize_recommendations(self, resume_data: Dict[str, Any], scoring_result: Any,
+                                  job_requirements: Dict[str, Any], cache_key: str,
+                                  recommendations: Dict[str, Any],
+                                  recommendation_count: int) -> Dict[str, Any]:
+        """Attach metadata, then log and cache a freshly generated recommendations dict"""
+        
         # Prepare context for recommendation generation
         improvement_context = {
             "overall_score": scoring_result.overall_score,
@@ -77,57 +501,175 @@ class ImprovementRecommendationAgent:
             "job_targeted": job_requirements is not None
         }
         
-        # Generate different types of recommendations
-        recommendations = {
-            "priority_actions": self._generate_priority_actions(
-                resume_data, scoring_result, job_requirements
-            ),
-            "content_improvements": self._generate_content_improvements(
-                resume_data, scoring_result, job_requirements
-            ),
-            "format_enhancements": self._generate_format_enhancements(
-                resume_data, scoring_result
-            ),
-            "keyword_optimization": self._generate_keyword_recommendations(
-                resume_data, job_requirements
-            ),
-            "skill_development": self._generate_skill_development_recommendations(
-                resume_data, job_requirements
-            ),
-            "section_specific": self._generate_section_specific_recommendations(
-                resume_data, scoring_result
-            ),
-            "before_after_examples": self._generate_before_after_examples(
-                resume_data, scoring_result
-            ),
-            "quick_wins": self._generate_quick_wins(resume_data, scoring_result),
-            "long_term_strategy": self._generate_long_term_strategy(
-                resume_data, job_requirements
-            )
-        }
-        
         # Add metadata
         recommendations["metadata"] = {
             "generation_timestamp": datetime.now().isoformat(),
-            "recommendation_count": sum(len(v) if isinstance(v, list) else 1 
-                                      for v in recommendations.values() if v),
+            "recommendation_count": recommendation_count,
             "improvement_context": improvement_context,
             "score_improvement_potential": self._estimate_improvement_potential(
                 scoring_result.category_scores
             )
         }
         
+        self._remember_recommendations(resume_data, scoring_result, cache_key, recommendations)
+        return recommendations
+    
+    def _remember_recommendations(self, resume_data: Dict[str, Any], scoring_result: Any,
+                                  cache_key: str, recommendations: Dict[str, Any]) -> Dict[str, Any]:
+        """Log a finished recommendations dict and cache a private copy; returns the copy"""
+        
         # Log recommendation generation
         self._log_recommendation_generation(resume_data, scoring_result, recommendations)
         
+        # The caller owns (and may modify) the dict it was handed
+        cached_recommendations = copy.deepcopy(recommendations)
+        self.recommendation_cache[cache_key] = cached_recommendations
+        if len(self.recommendation_cache) > self._CACHE_SIZE:
+            self.recommendation_cache.popitem(last=False)
+        return cached_recommendations
+    
+    def _serve_cached_recommendations(self, resume_data: Dict[str, Any], scoring_result: Any,
+                                      cached_recommendations: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a cached result with a fresh timestamp, logged like a new generation"""
+        
+        recommendations = copy.deepcopy(cached_recommendations)
+        recommendations["metadata"]["generation_timestamp"] = datetime.now().isoformat()
+        self._log_recommendation_generation(resume_data, scoring_result, recommendations)
         return recommendations
     
+    def _get_cached_recommendations(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Cached recommendations for cache_key (marked recently used), or None"""
+        
+        cached_recommendations = self.recommendation_cache.get(cache_key)
+        if cached_recommendations is not None:
+            self.recommendation_cache.move_to_end(cache_key)
+        return cached_recommendations
+    
+    def _job_hasher(self, job_requirements: Dict[str, Any] = None):
+        """Hasher pre-fed with the job requirements; copied once per resume"""
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(_key_bytes(job_requirements))
+        hasher.update(b"|")
+        return hasher
+    
+    def _generate_input_digest(self, resume_data: Dict[str, Any],
+                               job_requirements: Dict[str, Any] = None,
+                               job_hasher=None) -> str:
+        """Stable hash of the resume and job requirements"""
+        
+        if job_hasher is None:
+            job_hasher = self._job_hasher(job_requirements)
+        hasher = job_hasher.copy()
+        hasher.update(_key_bytes(resume_data))
+        return hasher.hexdigest()
+    
+    def _generate_cache_key(self, input_digest: str, scoring_result: Any) -> str:
+        """Stable hash of every input the recommendations depend on"""
+        
+        payload = _key_bytes([
+            input_digest,
+            scoring_result.overall_score,
+            scoring_result.category_scores,
+            scoring_result.detailed_breakdown.get("missing_elements", []),
+        ])
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _get_job_fit_recommendations(self, input_digest: str, resume_data: Dict[str, Any],
+                                     job_requirements: Dict[str, Any] = None) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+        """Keyword and skill-development recommendations, memoized on the input digest"""
+        
+        job_fit = self._job_fit_cache.get(input_digest)
+        if job_fit is not None:
+            self._job_fit_cache.move_to_end(input_digest)
+        else:
+            job_fit = (
+                self._generate_keyword_recommendations(resume_data, job_requirements),
+                self._generate_skill_development_recommendations(resume_data, job_requirements),
+            )
+            self._job_fit_cache[input_digest] = job_fit
+            if len(self._job_fit_cache) > self._CACHE_SIZE:
+                self._job_fit_cache.popitem(last=False)
+        
+        # Each recommendations dict gets its own sections; the cached ones stay pristine
+        return copy.deepcopy(job_fit)
+    
+    def _get_resume_text_lower(self, resume_data: Dict[str, Any]) -> str:
+        """Lowercased resume text, memoized per resume so re-targeting it at new jobs skips the walk"""
+        
+        resume_digest = hashlib.blake2b(_key_bytes(resume_data), digest_size=16).digest()
+        resume_text = self._resume_text_cache.get(resume_digest)
+        if resume_text is not None:
+            self._resume_text_cache.move_to_end(resume_digest)
+            return resume_text
+        
+        resume_text = self._extract_resume_text(resume_data).lower()
+        self._resume_text_cache[resume_digest] = resume_text
+        if len(self._resume_text_cache) > self._CACHE_SIZE:
+            self._resume_text_cache.popitem(last=False)
+        return resume_text
+    
     def _identify_weakest_areas(self, category_scores: Dict[str, float]) -> List[str]:
         """Identify the weakest scoring areas for prioritization"""
         
         sorted_scores = sorted(category_scores.items(), key=lambda x: x[1])
         return [category for category, score in sorted_scores if score < 70]
     
+    def _scan_experience(self, resume_data: Dict[str, Any]) -> ExperienceScan:
+        """Check every experience entry once for all the experience-based recommendations"""
+        
+        content_issues = []
+        missing_achievements = False
+        nonstandard_dates = False
+        unrecognized_dates = False
+        weak_example_bullet = None
+        experience = resume_data.get("experience") or []
+        
+        for exp in experience:
+            title = exp.get("title", "position")
+            responsibilities = exp.get("responsibilities", [])
+            has_achievements = bool(exp.get("achievements"))
+            start_date = exp.get("start_date", "")
+            
+            # Content improvements
+            if len(responsibilities) < 3:
+                content_issues.append(
+                    f"Add more responsibilities for {title} role (aim for 3-5 bullet points)"
+                )
+            if not has_achievements:
+                content_issues.append(
+                    f"Add quantified achievements for {title} with specific metrics"
+                )
+                missing_achievements = True
+            
+            # Weak action verbs across all of the role's bullets at once
+            bullets = _lowered_bullets(responsibilities) if responsibilities else ""
+            if any(weak_verb in bullets for weak_verb in _WEAK_PHRASES):
+                content_issues.append(
+                    "Replace weak phrases like 'responsible for' with strong action verbs like 'led', 'developed', 'implemented'"
+                )
+            if (weak_example_bullet is None
+                    and any(weak in bullets for weak in _WEAK_EXAMPLE_PHRASES)):
+                # Only the first matching role is scanned bullet by bullet
+                weak_example_bullet = next((resp for resp in responsibilities 
+                                          if any(weak in resp.lower() for weak in _WEAK_EXAMPLE_PHRASES)), None)
+            
+            # Date formats: strict for format enhancements, loose for quick wins
+            if start_date:
+                if not nonstandard_dates and not _DATE_RE.match(start_date):
+                    nonstandard_dates = True
+                if not unrecognized_dates and not _DATE_LOOSE_RE.match(start_date):
+                    unrecognized_dates = True
+        
+        return ExperienceScan(
+            entry_count=len(experience),
+            content_issues=content_issues,
+            missing_achievements=missing_achievements,
+            nonstandard_dates=nonstandard_dates,
+            unrecognized_dates=unrecognized_dates,
+            weak_example_bullet=weak_example_bullet
+        )
+    
     def _generate_priority_actions(self, resume_data: Dict[str, Any], 
                                  scoring_result: Any,
                                  job_requirements: Dict[str, Any] = None) -> List[Dict[str, Any]]:
@@ -140,51 +682,14 @@ class ImprovementRecommendationAgent:
         lowest_category = min(category_scores.items(), key=lambda x: x[1])
         
         if lowest_category[1] < 60:
-            if lowest_category[0] == "skills_match":
-                priority_actions.append({
-                    "priority": 1,
-                    "category": "Skills Enhancement",
-                    "action": "Add missing technical skills",
-                    "description": "Your skills section needs immediate attention. Add 3-5 relevant technical skills that match job requirements.",
-                    "impact": "High",
-                    "effort": "Low",
-                    "timeline": "1-2 hours"
-                })
-            
-            elif lowest_category[0] == "experience_relevance":
-                priority_actions.append({
-                    "priority": 1,
-                    "category": "Experience Enhancement", 
-                    "action": "Quantify achievements",
-                    "description": "Add numbers, percentages, or metrics to your accomplishments. Use action verbs and specific results.",
-                    "impact": "High",
-                    "effort": "Medium",
-                    "timeline": "3-4 hours"
-                })
-            
-            elif lowest_category[0] == "format_structure":
-                priority_actions.append({
-                    "priority": 1,
-                    "category": "Format Improvement",
-                    "action": "Restructure resume sections",
-                    "description": "Improve resume organization with clear headers, consistent formatting, and proper section order.",
-                    "impact": "Medium",
-                    "effort": "Medium", 
-                    "timeline": "2-3 hours"
-                })
+            template = _LOWEST_CATEGORY_ACTIONS.get(lowest_category[0])
+            if template is not None:
+                priority_actions.append({"priority": 1, **template})
         
         # Priority 2: Address missing critical elements
         missing_elements = scoring_result.detailed_breakdown.get("missing_elements", [])
         if "LinkedIn profile URL" in missing_elements:
-            priority_actions.append({
-                "priority": 2,
-                "category": "Contact Information",
-                "action": "Add LinkedIn profile",
-                "description": "Include your LinkedIn profile URL in the contact section.",
-                "impact": "Medium",
-                "effort": "Low",
-                "timeline": "15 minutes"
-            })
+            priority_actions.append({"priority": 2, **_LINKEDIN_ACTION})
         
         # Priority 3: Job-specific improvements
         if job_requirements:
@@ -204,6 +709,7 @@ class ImprovementRecommendationAgent:
     
     def _generate_content_improvements(self, resume_data: Dict[str, Any],
                                      scoring_result: Any,
+                                     experience: ExperienceScan,
                                      job_requirements: Dict[str, Any] = None) -> Dict[str, List[str]]:
         """Generate content-specific improvement recommendations"""
         
@@ -227,30 +733,7 @@ class ImprovementRecommendationAgent:
             )
         
         # Experience improvements
-        experience = resume_data.get("experience", [])
-        if experience:
-            for exp in experience:
-                responsibilities = exp.get("responsibilities", [])
-                achievements = exp.get("achievements", [])
-                
-                if len(responsibilities) < 3:
-                    improvements["experience_section"].append(
-                        f"Add more responsibilities for {exp.get('title', 'position')} role (aim for 3-5 bullet points)"
-                    )
-                
-                if not achievements:
-                    improvements["experience_section"].append(
-                        f"Add quantified achievements for {exp.get('title', 'position')} with specific metrics"
-                    )
-                
-                # Check for weak action verbs
-                weak_verbs = ["responsible for", "helped", "worked on", "assisted"]
-                for resp in responsibilities:
-                    if any(weak_verb in resp.lower() for weak_verb in weak_verbs):
-                        improvements["experience_section"].append(
-                            "Replace weak phrases like 'responsible for' with strong action verbs like 'led', 'developed', 'implemented'"
-                        )
-                        break
+        improvements["experience_section"].extend(experience.content_issues)
         
         # Skills improvements
         skills = resume_data.get("skills", {})
@@ -273,7 +756,8 @@ class ImprovementRecommendationAgent:
         return improvements
     
     def _generate_format_enhancements(self, resume_data: Dict[str, Any],
-                                    scoring_result: Any) -> List[Dict[str, str]]:
+                                    scoring_result: Any,
+                                    experience: ExperienceScan) -> List[Dict[str, str]]:
         """Generate format and structure enhancement recommendations"""
         
         enhancements = []
@@ -307,17 +791,7 @@ class ImprovementRecommendationAgent:
             })
         
         # Date formatting
-        experience = resume_data.get("experience", [])
-        inconsistent_dates = False
-        for exp in experience:
-            start_date = exp.get("start_date", "")
-            end_date = exp.get("end_date", "")
-            
-            if start_date and not re.match(r'\d{2}/\d{4}', start_date):
-                inconsistent_dates = True
-                break
-        
-        if inconsistent_dates:
+        if experience.nonstandard_dates:
             enhancements.append({
                 "type": "Date Formatting",
                 "recommendation": "Use consistent date format (MM/YYYY) throughout the resume",
@@ -352,7 +826,7 @@ class ImprovementRecommendationAgent:
         
         if job_requirements:
             # Extract current resume text
-            resume_text = self._extract_resume_text(resume_data).lower()
+            resume_text = self._get_resume_text_lower(resume_data)
             
             # Identify missing job keywords
             job_keywords = job_requirements.get("keywords", [])
@@ -360,10 +834,12 @@ class ImprovementRecommendationAgent:
             
             all_target_keywords = list(set(job_keywords + required_skills))
             
-            missing_keywords = []
-            for keyword in all_target_keywords:
-                if keyword.lower() not in resume_text:
-                    missing_keywords.append(keyword)
+            # One pass over the resume text finds every keyword that occurs in it; the
+            # keywords are lowercased once and shared by the matcher and the filter
+            lowered_keywords = _lowered_skills(tuple(all_target_keywords))
+            found_keywords = KeywordMatcher(lowered_keywords).find(resume_text)
+            missing_keywords = [keyword for keyword, lowered in zip(all_target_keywords, lowered_keywords)
+                                if lowered not in found_keywords]
             
             if missing_keywords:
                 recommendations["missing_keywords"] = missing_keywords[:10]  # Top 10 missing
@@ -405,17 +881,21 @@ class ImprovementRecommendationAgent:
             "learning_resources": []
         }
         
-        current_skills = self._extract_all_skills(resume_data)
+        # Lowercased once; every skill check below is a set lookup
+        current_lower = self._lowered_skill_set(resume_data)
         
         if job_requirements:
             # Skills gap analysis
             required_skills = job_requirements.get("required_skills", [])
             preferred_skills = job_requirements.get("preferred_skills", [])
             
-            missing_required = [skill for skill in required_skills 
-                              if skill.lower() not in [s.lower() for s in current_skills]]
-            missing_preferred = [skill for skill in preferred_skills
-                               if skill.lower() not in [s.lower() for s in current_skills]]
+            lowered_required = _lowered_skills(tuple(required_skills))
+            lowered_preferred = _lowered_skills(tuple(preferred_skills))
+            
+            missing_required = [skill for skill, lowered in zip(required_skills, lowered_required)
+                                if lowered not in current_lower]
+            missing_preferred = [skill for skill, lowered in zip(preferred_skills, lowered_preferred)
+                                 if lowered not in current_lower]
             
             if missing_required:
                 recommendations["immediate_skills"] = [
@@ -436,12 +916,12 @@ class ImprovementRecommendationAgent:
                 ]
         
         # General skill development
-        if "python" in [s.lower() for s in current_skills]:
+        if "python" in current_lower:
             recommendations["learning_resources"].append(
                 "Advance Python skills with frameworks like Django, Flask, or FastAPI"
             )
         
-        if "javascript" in [s.lower() for s in current_skills]:
+        if "javascript" in current_lower:
             recommendations["learning_resources"].append(
                 "Expand JavaScript knowledge with modern frameworks like React, Vue, or Angular"
             )
@@ -456,7 +936,8 @@ class ImprovementRecommendationAgent:
         return recommendations
     
     def _generate_section_specific_recommendations(self, resume_data: Dict[str, Any],
-                                                 scoring_result: Any) -> Dict[str, List[str]]:
+                                                 scoring_result: Any,
+                                                 experience: ExperienceScan) -> Dict[str, List[str]]:
         """Generate section-specific improvement recommendations"""
         
         recommendations = {
@@ -476,18 +957,15 @@ class ImprovementRecommendationAgent:
             recommendations["contact_section"].append("Include city and state/country")
         
         # Experience section
-        experience = resume_data.get("experience", [])
-        if len(experience) < 2:
+        if experience.entry_count < 2:
             recommendations["experience_section"].append(
                 "Include more work experience entries (even internships or projects)"
             )
         
-        for exp in experience:
-            if not exp.get("achievements"):
-                recommendations["experience_section"].append(
-                    "Add quantified achievements for each role"
-                )
-                break
+        if experience.missing_achievements:
+            recommendations["experience_section"].append(
+                "Add quantified achievements for each role"
+            )
         
         # Education section
         education = resume_data.get("education", [])
@@ -518,28 +996,20 @@ class ImprovementRecommendationAgent:
         return recommendations
     
     def _generate_before_after_examples(self, resume_data: Dict[str, Any],
-                                      scoring_result: Any) -> List[Dict[str, str]]:
+                                      scoring_result: Any,
+                                      experience: ExperienceScan) -> List[Dict[str, str]]:
         """Generate before/after examples for improvements"""
         
         examples = []
         
         # Experience bullet point examples
-        experience = resume_data.get("experience", [])
-        if experience:
-            for exp in experience:
-                responsibilities = exp.get("responsibilities", [])
-                if responsibilities:
-                    weak_bullet = next((resp for resp in responsibilities 
-                                      if any(weak in resp.lower() for weak in ["responsible for", "helped", "worked on"])), None)
-                    
-                    if weak_bullet:
-                        examples.append({
-                            "section": "Experience",
-                            "before": weak_bullet,
-                            "after": "Led development of web application features, resulting in 25% increase in user engagement",
-                            "improvement": "Use strong action verbs and quantify results"
-                        })
-                        break
+        if experience.weak_example_bullet:
+            examples.append({
+                "section": "Experience",
+                "before": experience.weak_example_bullet,
+                "after": "Led development of web application features, resulting in 25% increase in user engagement",
+                "improvement": "Use strong action verbs and quantify results"
+            })
         
         # Skills section example
         skills = resume_data.get("skills", {})
@@ -565,7 +1035,8 @@ class ImprovementRecommendationAgent:
         return examples
     
     def _generate_quick_wins(self, resume_data: Dict[str, Any],
-                           scoring_result: Any) -> List[Dict[str, str]]:
+                           scoring_result: Any,
+                           experience: ExperienceScan) -> List[Dict[str, str]]:
         """Generate quick wins that can be implemented immediately"""
         
         quick_wins = []
@@ -593,23 +1064,17 @@ class ImprovementRecommendationAgent:
                 })
         
         # Date consistency
-        experience = resume_data.get("experience", [])
-        if experience:
-            inconsistent_dates = any(
-                exp.get("start_date") and not re.match(r'\d{1,2}/\d{4}', exp.get("start_date", ""))
-                for exp in experience
-            )
-            if inconsistent_dates:
-                quick_wins.append({
-                    "action": "Standardize Date Format",
-                    "description": "Use MM/YYYY format consistently for all dates",
-                    "time_required": "5 minutes",
-                    "impact": "Medium"
-                })
+        if experience.unrecognized_dates:
+            quick_wins.append({
+                "action": "Standardize Date Format",
+                "description": "Use MM/YYYY format consistently for all dates",
+                "time_required": "5 minutes",
+                "impact": "Medium"
+            })
         
         # Email format
         email = personal_info.get("email", "")
-        if email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+        if email and not _EMAIL_RE.match(email):
             quick_wins.append({
                 "action": "Fix Email Format",
                 "description": "Ensure email address is properly formatted",
@@ -635,55 +1100,20 @@ class ImprovementRecommendationAgent:
         years_experience = self._estimate_total_experience(current_experience)
         
         # Experience-based recommendations
-        if years_experience < 2:
-            strategy["experience_building"] = [
-                "Focus on building foundational experience in core technologies",
-                "Seek mentorship opportunities with senior developers",
-                "Contribute to open-source projects to build portfolio",
-                "Consider internships or entry-level positions for experience"
-            ]
-        elif years_experience < 5:
-            strategy["experience_building"] = [
-                "Take on leadership roles in projects",
-                "Develop expertise in specific technology domains",
-                "Start mentoring junior team members",
-                "Pursue complex technical challenges and solutions"
-            ]
-        else:
-            strategy["experience_building"] = [
-                "Focus on strategic technical leadership",
-                "Drive architectural decisions and technology adoption",
-                "Build cross-functional collaboration skills",
-                "Consider management or technical lead opportunities"
-            ]
+        strategy["experience_building"] = list(
+            _EXPERIENCE_BUILDING[bisect.bisect_right(_EXPERIENCE_THRESHOLDS, years_experience)]
+        )
         
         # Industry positioning
         if job_requirements:
             industry = job_requirements.get("company_info", {}).get("industry", "technology")
             
-            if industry == "technology":
-                strategy["industry_positioning"] = [
-                    "Stay current with emerging technology trends",
-                    "Build expertise in cloud technologies and DevOps",
-                    "Develop understanding of AI/ML applications",
-                    "Focus on scalable system design and architecture"
-                ]
-            elif industry == "finance":
-                strategy["industry_positioning"] = [
-                    "Understand financial domain and regulatory requirements",
-                    "Develop expertise in security and compliance",
-                    "Learn about fintech trends and blockchain technology",
-                    "Focus on high-performance, reliable system development"
-                ]
+            positioning = _INDUSTRY_POSITIONING.get(industry)
+            if positioning is not None:
+                strategy["industry_positioning"] = list(positioning)
         
         # Networking recommendations
-        strategy["networking_recommendations"] = [
-            "Join professional associations in your field",
-            "Attend industry conferences and meetups",
-            "Engage actively on LinkedIn with industry content",
-            "Build relationships with colleagues and industry peers",
-            "Consider speaking at conferences or writing technical blogs"
-        ]
+        strategy["networking_recommendations"] = list(_NETWORKING_RECOMMENDATIONS)
         
         return strategy
     
@@ -699,6 +1129,14 @@ class ImprovementRecommendationAgent:
         
         return all_skills
     
+    def _lowered_skill_set(self, resume_data: Dict[str, Any]) -> frozenset:
+        """Lowercased resume skills for O(1) membership checks"""
+        
+        pass_skills = self._pass_skills
+        if pass_skills is not None and pass_skills[0] is resume_data:
+            return pass_skills[1]
+        return frozenset(skill.lower() for skill in self._extract_all_skills(resume_data))
+    
     def _extract_resume_text(self, resume_data: Dict[str, Any]) -> str:
         """Extract all text content from resume data"""
         
@@ -733,15 +1171,16 @@ class ImprovementRecommendationAgent:
                                    job_requirements: Dict[str, Any]) -> List[str]:
         """Identify skills mentioned in job requirements but missing from resume"""
         
-        resume_skills = [skill.lower() for skill in self._extract_all_skills(resume_data)]
-        required_skills = [skill.lower() for skill in job_requirements.get("required_skills", [])]
+        resume_skills = self._lowered_skill_set(resume_data)
         
+        required_skills = _lowered_skills(tuple(job_requirements.get("required_skills", [])))
         return [skill for skill in required_skills if skill not in resume_skills]
     
     def _estimate_total_experience(self, experience: List[Dict[str, Any]]) -> float:
         """Estimate total years of experience"""
         
         total_years = 0.0
+        current_year = None  # read from the clock once, on the first open-ended role
         
         for exp in experience:
             start_date = exp.get("start_date", "")
@@ -749,15 +1188,18 @@ class ImprovementRecommendationAgent:
             
             if start_date:
                 try:
-                    start_parts = start_date.split("/")
-                    if len(start_parts) >= 2:
-                        start_year = int(start_parts[-1])
+                    # rpartition yields the last "/"-separated part without building a list
+                    _, start_sep, start_tail = start_date.rpartition("/")
+                    if start_sep:
+                        start_year = int(start_tail)
                         
                         if end_date.lower() == "present":
-                            end_year = datetime.now().year
+                            if current_year is None:
+                                current_year = datetime.now().year
+                            end_year = current_year
                         else:
-                            end_parts = end_date.split("/")
-                            end_year = int(end_parts[-1]) if len(end_parts) >= 2 else start_year
+                            _, end_sep, end_tail = end_date.rpartition("/")
+                            end_year = int(end_tail) if end_sep else start_year
                         
                         years = end_year - start_year
                         total_years += max(years, 0)
@@ -770,51 +1212,62 @@ class ImprovementRecommendationAgent:
     def _estimate_improvement_potential(self, category_scores: Dict[str, float]) -> Dict[str, float]:
         """Estimate potential score improvement by category"""
         
-        potential = {}
-        
-        for category, score in category_scores.items():
-            if score < 50:
-                potential[category] = 30  # High improvement potential
-            elif score < 70:
-                potential[category] = 20  # Medium improvement potential
-            elif score < 85:
-                potential[category] = 10  # Low improvement potential
-            else:
-                potential[category] = 5   # Minimal improvement potential
-        
-        return potential
+        return {
+            category: _POTENTIAL_POINTS[bisect.bisect_right(_POTENTIAL_THRESHOLDS, score)]
+            for category, score in category_scores.items()
+        }
     
     def _log_recommendation_generation(self, resume_data: Dict[str, Any],
                                      scoring_result: Any,
                                      recommendations: Dict[str, Any]):
         """Log recommendation generation for tracking"""
         
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "initial_score": scoring_result.overall_score,
-            "recommendation_count": recommendations["metadata"]["recommendation_count"],
-            "weakest_areas": self._identify_weakest_areas(scoring_result.category_scores),
-            "has_job_requirements": recommendations["metadata"]["improvement_context"]["job_targeted"]
-        }
+        metadata = recommendations["metadata"]
+        improvement_context = metadata["improvement_context"]
+        log_entry = RecommendationLogEntry(
+            # Same instant as the metadata; the clock is read and formatted once per call
+            timestamp=metadata["generation_timestamp"],
+            initial_score=scoring_result.overall_score,
+            recommendation_count=metadata["recommendation_count"],
+            # Already ranked for the improvement context from the same category scores
+            weakest_areas=tuple(improvement_context["weakest_areas"]),
+            has_job_requirements=improvement_context["job_targeted"]
+        )
         
-        self.recommendation_history.append(log_entry)
+        history = self.recommendation_history
+        if len(history) == history.maxlen:
+            # The oldest entry is about to be evicted; drop it from the totals
+            evicted = history[0]
+            self._score_sum -= evicted.initial_score
+            self._recommendation_count_sum -= evicted.recommendation_count
+            self._job_targeted_count -= evicted.has_job_requirements
+            weak_area_counter = self._weak_area_counter
+            for area in evicted.weakest_areas:
+                weak_area_counter[area] -= 1
+                if not weak_area_counter[area]:
+                    del weak_area_counter[area]
+        
+        history.append(log_entry)
+        self._score_sum += log_entry.initial_score
+        self._recommendation_count_sum += log_entry.recommendation_count
+        self._job_targeted_count += log_entry.has_job_requirements
+        self._weak_area_counter.update(log_entry.weakest_areas)
     
     def get_recommendation_statistics(self) -> Dict[str, Any]:
-        """Get recommendation generation statistics"""
+        """Get recommendation generation statistics over the last _HISTORY_SIZE generations"""
         
         if not self.recommendation_history:
             return {"message": "No recommendation history available"}
         
         total_recommendations = len(self.recommendation_history)
-        avg_score = sum(log["initial_score"] for log in self.recommendation_history) / total_recommendations
-        avg_recommendations = sum(log["recommendation_count"] for log in self.recommendation_history) / total_recommendations
+        avg_score = self._score_sum / total_recommendations
+        avg_recommendations = self._recommendation_count_sum / total_recommendations
         
         stats = {
             "total_recommendations_generated": total_recommendations,
             "average_initial_score": avg_score,
             "average_recommendations_per_resume": avg_recommendations,
-            "job_targeted_percentage": len([log for log in self.recommendation_history 
-                                          if log["has_job_requirements"]]) / total_recommendations * 100,
+            "job_targeted_percentage": self._job_targeted_count / total_recommendations * 100,
             "common_weak_areas": self._get_common_weak_areas()
         }
         
@@ -823,13 +1276,30 @@ class ImprovementRecommendationAgent:
     def _get_common_weak_areas(self) -> Dict[str, int]:
         """Get most common weak areas across all recommendations"""
         
-        weak_area_counts = {}
-        
-        for log in self.recommendation_history:
-            for area in log["weakest_areas"]:
-                weak_area_counts[area] = weak_area_counts.get(area, 0) + 1
-        
-        return dict(sorted(weak_area_counts.items(), key=lambda x: x[1], reverse=True))
+        # Most frequent first; ties keep the order the areas were first counted in
+        return dict(self._weak_area_counter.most_common())
+
+
+# Per-process state for generate_improvements_many workers: (agent, job_requirements, job_hasher)
+_worker_state = None
+
+
+def _worker_init(job_requirements: Dict[str, Any]):
+    """Process pool initializer: build one agent per worker (its AutoGen assistant is never created)"""
+    
+    global _worker_state
+    agent = ImprovementRecommendationAgent([])
+    _worker_state = (agent, job_requirements, agent._job_hasher(job_requirements))
+
+
+def _worker_improve(resume_data: Dict[str, Any], scoring_result: Any) -> Dict[str, Any]:
+    """Generate recommendations for one resume in a pool worker"""
+    
+    agent, job_requirements, job_hasher = _worker_state
+    return agent._generate_improvements(
+        resume_data, scoring_result, job_requirements,
+        agent._generate_input_digest(resume_data, job_hasher=job_hasher)
+    )
 
 
 # Example usage and testing
@@ -876,7 +1346,7 @@ def test_improvement_agent():
     )
     
     print("Improvement Recommendations Generated:")
-    print(json.dumps(recommendations, indent=2))
+    print(_pretty_json(recommendations))
 
 
 if __name__ == "__main__":
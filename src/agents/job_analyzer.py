@@ -5,105 +5,62 @@ Extracts requirements and creates matching criteria from job descriptions
 
 import autogen
 from typing import Dict, List, Any, Optional
+import asyncio
+import copy
+import functools
+import hashlib
 import json
+import queue
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
 
-class JobDescriptionAnalyzer:
-    """
-    AutoGen agent for analyzing job descriptions and extracting requirements
-    """
-    
-    def __init__(self, config_list: List[Dict[str, Any]]):
-        self.config_list = config_list
-        self.analysis_history = []
-        
-        # Create the AutoGen agent
-        self.agent = autogen.AssistantAgent(
-            name="Job_Description_Analyzer",
-            llm_config={"config_list": config_list},
-            system_message="""You are a specialized Job Description Analyzer with expertise in:
-            
-            1. REQUIREMENT EXTRACTION:
-            - Identify must-have vs. nice-to-have skills
-            - Extract years of experience requirements
-            - Determine education requirements
-            - Identify industry-specific keywords
-            
-            2. SKILL CATEGORIZATION:
-            - Technical skills (programming, tools, technologies)
-            - Soft skills (communication, leadership, teamwork)
-            - Domain expertise (industry knowledge, certifications)
-            - Experience levels (junior, mid-level, senior)
-            
-            3. MATCHING CRITERIA DEVELOPMENT:
-            - Create weighted matching criteria
-            - Define minimum qualification thresholds
-            - Establish scoring priorities
-            - Generate keyword lists for ATS optimization
-            
-            4. CONTEXT ANALYSIS:
-            - Company culture indicators
-            - Role responsibilities and expectations
-            - Career growth opportunities
-            - Compensation and benefits insights
-            
-            Provide structured, actionable analysis that can be used for precise
-            resume matching and candidate evaluation."""
-        )
-    
-    def analyze_job_description(self, job_description: str, industry: str = "general") -> Dict[str, Any]:
-        """
-        Analyze a job description and extract structured requirements
-        
-        Args:
-            job_description: Raw job description text
-            industry: Industry context for analysis
-            
-        Returns:
-            Structured job requirements and matching criteria
-        """
-        
-        analysis_prompt = f"""
-        Analyze the following job description and extract structured requirements.
-        Provide a comprehensive analysis in JSON format.
-        
-        JOB DESCRIPTION:
-        {job_description}
-        
-        Please structure your analysis as follows:
-        {{
+# Fallback-parsing patterns, compiled once at import
+_SKILL_PATTERNS = (
+    re.compile(r'\b(python|java|javascript|react|angular|node\.js|sql|mongodb|aws|docker|kubernetes)\b'),
+    re.compile(r'\b(machine learning|ai|data science|deep learning|nlp|computer vision)\b'),
+    re.compile(r'\b(git|github|linux|windows|agile|scrum|devops|ci/cd)\b'),
+)
+_EXPERIENCE_RE = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)')
+
+# Recorded in analysis metadata and part of every cache key: bump it when the prompts
+# change so earlier LLM results are no longer served
+_ANALYZER_VERSION = '1.0'
+
+# JSON layout requested for each analysis, shared by the single and batch prompts
+_ANALYSIS_SCHEMA = """{
             "job_title": "Extracted job title",
-            "company_info": {{
+            "company_info": {
                 "company_name": "Company name if mentioned",
                 "industry": "Industry/sector",
                 "company_size": "Company size indicators"
-            }},
+            },
             "required_skills": [
                 "List of must-have technical skills"
             ],
             "preferred_skills": [
                 "List of nice-to-have skills"
             ],
-            "required_experience": {{
+            "required_experience": {
                 "years_required": "Minimum years of experience",
                 "experience_type": "Type of experience required",
                 "specific_domains": ["Specific experience domains"]
-            }},
-            "education_requirements": {{
+            },
+            "education_requirements": {
                 "required_degree": "Minimum education requirement",
                 "preferred_degree": "Preferred education level", 
                 "relevant_fields": ["Relevant fields of study"],
                 "certifications": ["Required or preferred certifications"]
-            }},
-            "technical_requirements": {{
+            },
+            "technical_requirements": {
                 "programming_languages": ["Programming languages mentioned"],
                 "frameworks_libraries": ["Frameworks and libraries"],
                 "tools_technologies": ["Tools and technologies"],
                 "databases": ["Database technologies"],
                 "cloud_platforms": ["Cloud platforms"]
-            }},
+            },
             "soft_skills": [
                 "Communication, leadership, and other soft skills"
             ],
@@ -127,18 +84,122 @@ class JobDescriptionAnalyzer:
             "company_culture": [
                 "Company culture indicators"
             ],
-            "scoring_weights": {{
+            "scoring_weights": {
                 "technical_skills_weight": 0.4,
                 "experience_weight": 0.3,
                 "education_weight": 0.15,
                 "soft_skills_weight": 0.15
-            }},
-            "matching_criteria": {{
+            },
+            "matching_criteria": {
                 "minimum_skill_match": "Percentage of required skills needed",
                 "experience_flexibility": "Flexibility in experience requirements",
                 "education_flexibility": "Flexibility in education requirements"
-            }}
-        }}
+            }
+        }"""
+
+# Job description characters sent per batched analysis request
+_MAX_BATCH_CHARS = 24_000
+
+# System message of every analyzer assistant agent
+_SYSTEM_MESSAGE = """You are a specialized Job Description Analyzer with expertise in:
+            
+            1. REQUIREMENT EXTRACTION:
+            - Identify must-have vs. nice-to-have skills
+            - Extract years of experience requirements
+            - Determine education requirements
+            - Identify industry-specific keywords
+            
+            2. SKILL CATEGORIZATION:
+            - Technical skills (programming, tools, technologies)
+            - Soft skills (communication, leadership, teamwork)
+            - Domain expertise (industry knowledge, certifications)
+            - Experience levels (junior, mid-level, senior)
+            
+            3. MATCHING CRITERIA DEVELOPMENT:
+            - Create weighted matching criteria
+            - Define minimum qualification thresholds
+            - Establish scoring priorities
+            - Generate keyword lists for ATS optimization
+            
+            4. CONTEXT ANALYSIS:
+            - Company culture indicators
+            - Role responsibilities and expectations
+            - Career growth opportunities
+            - Compensation and benefits insights
+            
+            Provide structured, actionable analysis that can be used for precise
+            resume matching and candidate evaluation."""
+
+# LLM chats one analyzer runs at once from analyze_full, to stay within provider rate limits
+_MAX_CONCURRENT_CHATS = 4
+
+
+def _text_cache_key(*parts: str) -> str:
+    """Cache key for LLM results; collapsed whitespace lets re-pasted text hit the same entry"""
+    
+    normalized = "\x1f".join([_ANALYZER_VERSION, *(" ".join(part.split()) for part in parts)])
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+class JobDescriptionAnalyzer:
+    """
+    AutoGen agent for analyzing job descriptions and extracting requirements
+    """
+    
+    _CACHE_SIZE = 256
+    
+    def __init__(self, config_list: List[Dict[str, Any]]):
+        self.config_list = config_list
+        self.analysis_history = []
+        # Successful LLM results, LRU; each is a round trip worth seconds
+        self._analysis_cache = OrderedDict()
+        self._insights_cache = OrderedDict()
+        # analyze_full reads and fills the caches from several threads at once
+        self._cache_lock = threading.Lock()
+        self._chat_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_CHATS)
+        self._idle_proxies = queue.SimpleQueue()
+        self._idle_assistants = queue.SimpleQueue()
+        
+        # Create the AutoGen agent; it is the first pooled assistant
+        self.agent = self._create_assistant()
+        self._idle_assistants.put(self.agent)
+    
+    def _create_assistant(self):
+        """Build an analyzer assistant agent"""
+        
+        return autogen.AssistantAgent(
+            name="Job_Description_Analyzer",
+            llm_config={"config_list": self.config_list},
+            system_message=_SYSTEM_MESSAGE
+        )
+    
+    def analyze_job_description(self, job_description: str, industry: str = "general") -> Dict[str, Any]:
+        """
+        Analyze a job description and extract structured requirements
+        
+        Args:
+            job_description: Raw job description text
+            industry: Industry context for analysis
+            
+        Returns:
+            Structured job requirements and matching criteria
+        """
+        
+        # Repeat descriptions reuse the earlier LLM analysis instead of a new chat
+        cache_key = _text_cache_key(industry, job_description)
+        cached_analysis = self._cached_analysis(cache_key, job_description)
+        if cached_analysis is not None:
+            return cached_analysis
+        
+        analysis_prompt = f"""
+        Analyze the following job description and extract structured requirements.
+        Provide a comprehensive analysis in JSON format.
+        
+        JOB DESCRIPTION:
+        {job_description}
+        
+        Please structure your analysis as follows:
+        {_ANALYSIS_SCHEMA}
         
         ANALYSIS GUIDELINES:
         1. Extract information exactly as stated in the job description
@@ -151,21 +212,9 @@ class JobDescriptionAnalyzer:
         Return only the JSON object, no additional text.
         """
         
-        # Use the AutoGen agent to process the analysis
-        user_proxy = autogen.UserProxyAgent(
-            name="User",
-            human_input_mode="NEVER",
-            max_consecutive_auto_reply=0,
-            code_execution_config=False
-        )
-        
         # Initiate conversation for analysis
         try:
-            response = user_proxy.initiate_chat(
-                self.agent,
-                message=analysis_prompt,
-                silent=True
-            )
+            response = self._initiate_chat(analysis_prompt)
             
             # Extract JSON from response
             last_message = response.chat_history[-1]['content']
@@ -178,19 +227,7 @@ class JobDescriptionAnalyzer:
                 json_str = last_message[json_start:json_end]
                 analysis_result = json.loads(json_str)
                 
-                # Add metadata
-                analysis_result['analysis_metadata'] = {
-                    'analysis_timestamp': datetime.now().isoformat(),
-                    'analyzer_version': '1.0',
-                    'industry_context': industry,
-                    'text_length': len(job_description),
-                    'extraction_method': 'llm_analysis'
-                }
-                
-                # Log the analysis
-                self._log_analysis(job_description, analysis_result)
-                
-                return analysis_result
+                return self._finish_llm_analysis(job_description, industry, cache_key, analysis_result)
             else:
                 raise ValueError("No valid JSON found in response")
                 
@@ -198,6 +235,179 @@ class JobDescriptionAnalyzer:
             # Fallback to basic parsing if LLM analysis fails
             return self._fallback_analysis(job_description, industry)
     
+    async def analyze_full(self, job_description: str, industry: str = "general") -> Dict[str, Any]:
+        """
+        Analyze a job description and extract company insights concurrently
+        
+        Args:
+            job_description: Raw job description text
+            industry: Industry context for analysis
+            
+        Returns:
+            {"analysis": analyze_job_description result,
+             "company_insights": extract_company_insights result}
+        """
+        
+        # The two chats are independent and network-bound; AutoGen is synchronous, so
+        # each runs on a worker thread (run_in_executor, since asyncio.to_thread needs 3.9)
+        loop = asyncio.get_running_loop()
+        analysis, insights = await asyncio.gather(
+            loop.run_in_executor(None, functools.partial(
+                self._with_chat_slot, self.analyze_job_description, job_description, industry)),
+            loop.run_in_executor(None, functools.partial(
+                self._with_chat_slot, self.extract_company_insights, job_description)),
+        )
+        return {"analysis": analysis, "company_insights": insights}
+    
+    def _with_chat_slot(self, func, *args):
+        """Call func once one of the analyzer's concurrent chat slots is free"""
+        
+        with self._chat_slots:
+            return func(*args)
+    
+    def analyze_job_descriptions_batch(self, job_descriptions: List[str], industry: str = "general",
+                                       max_batch_chars: int = _MAX_BATCH_CHARS) -> List[Dict[str, Any]]:
+        """
+        Analyze many job descriptions, packing several into each LLM request
+        
+        Args:
+            job_descriptions: Raw job description texts
+            industry: Industry context shared by every description
+            max_batch_chars: Job description characters sent per request
+            
+        Returns:
+            One analysis per job description, in input order; descriptions the
+            batched reply doesn't cover are analyzed one at a time
+        """
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(job_descriptions)
+        cache_keys = [_text_cache_key(industry, job_description) for job_description in job_descriptions]
+        
+        # Cached descriptions are served directly; the rest are grouped by size
+        batches = []
+        batch, batch_chars = [], 0
+        for index, job_description in enumerate(job_descriptions):
+            results[index] = self._cached_analysis(cache_keys[index], job_description)
+            if results[index] is not None:
+                continue
+            if batch and batch_chars + len(job_description) > max_batch_chars:
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            batch.append(index)
+            batch_chars += len(job_description)
+        if batch:
+            batches.append(batch)
+        
+        for batch in batches:
+            if len(batch) > 1:
+                parsed = self._request_batch_analysis(
+                    [job_descriptions[index] for index in batch], industry
+                )
+                for position, analysis_result in parsed.items():
+                    index = batch[position]
+                    results[index] = self._finish_llm_analysis(
+                        job_descriptions[index], industry, cache_keys[index], analysis_result
+                    )
+            
+            # Single descriptions, and any the batched reply left out, go through the regular path
+            for index in batch:
+                if results[index] is None:
+                    results[index] = self.analyze_job_description(job_descriptions[index], industry)
+        
+        return results
+    
+    def _request_batch_analysis(self, job_descriptions: List[str],
+                                industry: str) -> Dict[int, Dict[str, Any]]:
+        """Ask for several analyses in one chat; returns the parsed ones by batch position"""
+        
+        sections = "\n\n".join(
+            f"JOB_{position}:\n{job_description}"
+            for position, job_description in enumerate(job_descriptions, start=1)
+        )
+        batch_prompt = f"""
+        Analyze each of the following {len(job_descriptions)} job descriptions and extract
+        structured requirements for each one.
+        
+        {sections}
+        
+        Return a JSON object {{"results": [...]}} with exactly one analysis per job, in
+        JOB_1, JOB_2, ... order. Each analysis has a "job_index" field holding its JOB
+        number and otherwise follows this structure:
+        {_ANALYSIS_SCHEMA}
+        
+        ANALYSIS GUIDELINES:
+        1. Extract information exactly as stated in each job description
+        2. Distinguish between required (must-have) and preferred (nice-to-have)
+        3. Identify implicit requirements that may not be explicitly stated
+        4. Consider industry context: {industry}
+        5. Prioritize skills and requirements based on emphasis in the text
+        6. Generate comprehensive keyword list for ATS optimization
+        
+        Return only the JSON object, no additional text.
+        """
+        
+        try:
+            response = self._initiate_chat(batch_prompt)
+            
+            last_message = response.chat_history[-1]['content']
+            json_start = last_message.find('{')
+            json_end = last_message.rfind('}') + 1
+            if json_start == -1:
+                return {}
+            batch_results = json.loads(last_message[json_start:json_end]).get("results")
+        except (json.JSONDecodeError, AttributeError):
+            return {}
+        
+        if not isinstance(batch_results, list):
+            return {}
+        
+        # Map replies back by their JOB number, falling back to list position
+        parsed = {}
+        for position, analysis_result in enumerate(batch_results):
+            if not isinstance(analysis_result, dict):
+                continue
+            job_index = analysis_result.pop("job_index", position + 1)
+            if isinstance(job_index, int) and 1 <= job_index <= len(job_descriptions):
+                parsed.setdefault(job_index - 1, analysis_result)
+        return parsed
+    
+    def _cached_analysis(self, cache_key: str, job_description: str) -> Optional[Dict[str, Any]]:
+        """Copy of a cached LLM analysis with this call's metadata (logged), or None"""
+        
+        cached_analysis = self._get_cached(self._analysis_cache, cache_key)
+        if cached_analysis is None:
+            return None
+        
+        analysis_result = copy.deepcopy(cached_analysis)
+        analysis_result['analysis_metadata'].update(
+            analysis_timestamp=datetime.now().isoformat(),
+            text_length=len(job_description),
+            extraction_method='llm_cache'
+        )
+        self._log_analysis(job_description, analysis_result)
+        return analysis_result
+    
+    def _finish_llm_analysis(self, job_description: str, industry: str, cache_key: str,
+                             analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach metadata to a parsed LLM analysis, then log and cache it"""
+        
+        # Add metadata
+        analysis_result['analysis_metadata'] = {
+            'analysis_timestamp': datetime.now().isoformat(),
+            'analyzer_version': _ANALYZER_VERSION,
+            'industry_context': industry,
+            'text_length': len(job_description),
+            'extraction_method': 'llm_analysis'
+        }
+        
+        # Log the analysis
+        self._log_analysis(job_description, analysis_result)
+        
+        # Cache a private copy; the caller is free to modify the returned dict
+        self._put_cached(self._analysis_cache, cache_key, copy.deepcopy(analysis_result))
+        
+        return analysis_result
+    
     def _fallback_analysis(self, job_description: str, industry: str) -> Dict[str, Any]:
         """
         Fallback analysis method using regex patterns
@@ -208,19 +418,11 @@ class JobDescriptionAnalyzer:
         
         # Extract technical skills using common patterns
         tech_skills = []
-        skill_patterns = [
-            r'\b(python|java|javascript|react|angular|node\.js|sql|mongodb|aws|docker|kubernetes)\b',
-            r'\b(machine learning|ai|data science|deep learning|nlp|computer vision)\b',
-            r'\b(git|github|linux|windows|agile|scrum|devops|ci/cd)\b'
-        ]
-        
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text)
-            tech_skills.extend(matches)
+        for pattern in _SKILL_PATTERNS:
+            tech_skills.extend(pattern.findall(text))
         
         # Extract experience requirements
-        experience_pattern = r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)'
-        experience_matches = re.findall(experience_pattern, text)
+        experience_matches = _EXPERIENCE_RE.findall(text)
         years_required = max([int(match) for match in experience_matches], default=0)
         
         # Extract education requirements
@@ -282,7 +484,7 @@ class JobDescriptionAnalyzer:
             },
             "analysis_metadata": {
                 "analysis_timestamp": datetime.now().isoformat(),
-                "analyzer_version": '1.0',
+                "analyzer_version": _ANALYZER_VERSION,
                 "industry_context": industry,
                 "text_length": len(job_description),
                 "extraction_method": 'fallback_regex',
@@ -376,6 +578,11 @@ class JobDescriptionAnalyzer:
             Company insights and culture indicators
         """
         
+        cache_key = _text_cache_key(job_description)
+        cached_insights = self._get_cached(self._insights_cache, cache_key)
+        if cached_insights is not None:
+            return copy.deepcopy(cached_insights)
+        
         insights_prompt = f"""
         Analyze the following job description for company culture and workplace insights.
         Focus on understanding the work environment, company values, and candidate fit indicators.
@@ -420,18 +627,7 @@ class JobDescriptionAnalyzer:
         """
         
         try:
-            user_proxy = autogen.UserProxyAgent(
-                name="User",
-                human_input_mode="NEVER",
-                max_consecutive_auto_reply=0,
-                code_execution_config=False
-            )
-            
-            response = user_proxy.initiate_chat(
-                self.agent,
-                message=insights_prompt,
-                silent=True
-            )
+            response = self._initiate_chat(insights_prompt)
             
             last_message = response.chat_history[-1]['content']
             json_start = last_message.find('{')
@@ -439,7 +635,9 @@ class JobDescriptionAnalyzer:
             
             if json_start != -1 and json_end != -1:
                 json_str = last_message[json_start:json_end]
-                return json.loads(json_str)
+                insights = json.loads(json_str)
+                self._put_cached(self._insights_cache, cache_key, copy.deepcopy(insights))
+                return insights
                 
         except Exception as e:
             pass
@@ -475,6 +673,56 @@ class JobDescriptionAnalyzer:
             "candidate_fit_indicators": []
         }
     
+    def _initiate_chat(self, message: str):
+        """Run one chat between a pooled analyzer agent and a pooled user proxy"""
+        
+        # Agents keep per-conversation history and reply counters, so a concurrent chat
+        # (analyze_full) must not share either one; each chat takes its own pair from
+        # the pools, building a new agent only when none is idle
+        try:
+            user_proxy = self._idle_proxies.get_nowait()
+        except queue.Empty:
+            user_proxy = autogen.UserProxyAgent(
+                name="User",
+                human_input_mode="NEVER",
+                max_consecutive_auto_reply=0,
+                code_execution_config=False
+            )
+        try:
+            assistant = self._idle_assistants.get_nowait()
+        except queue.Empty:
+            assistant = self._create_assistant()
+        
+        try:
+            # Drop the previous chat's messages and reply counters before reuse
+            user_proxy.reset()
+            assistant.reset()
+            return user_proxy.initiate_chat(
+                assistant,
+                message=message,
+                silent=True
+            )
+        finally:
+            self._idle_assistants.put(assistant)
+            self._idle_proxies.put(user_proxy)
+    
+    def _get_cached(self, cache: OrderedDict, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Cached LLM result for cache_key (marked recently used), or None"""
+        
+        with self._cache_lock:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                cache.move_to_end(cache_key)
+            return cached
+    
+    def _put_cached(self, cache: OrderedDict, cache_key: str, result: Dict[str, Any]):
+        """Store an LLM result, evicting the least recently used entry when full"""
+        
+        with self._cache_lock:
+            cache[cache_key] = result
+            if len(cache) > self._CACHE_SIZE:
+                cache.popitem(last=False)
+    
     def _log_analysis(self, job_description: str, analysis_result: Dict[str, Any]):
         """Log analysis for tracking and improvement"""
         
@@ -507,7 +755,9 @@ class JobDescriptionAnalyzer:
                 "llm_analysis": len([log for log in self.analysis_history 
                                    if log.get("extraction_method") == "llm_analysis"]),
                 "fallback_regex": len([log for log in self.analysis_history 
-                                     if log.get("extraction_method") == "fallback_regex"])
+                                     if log.get("extraction_method") == "fallback_regex"]),
+                "llm_cache": len([log for log in self.analysis_history 
+                                if log.get("extraction_method") == "llm_cache"])
             }
         }
         
@@ -563,9 +813,10 @@ def test_job_analyzer():
     # Initialize analyzer
     analyzer = JobDescriptionAnalyzer(config_list)
     
-    # Analyze job description
+    # Analyze job description and extract company insights concurrently
     print("Analyzing job description...")
-    analysis = analyzer.analyze_job_description(sample_jd, "technology")
+    full_analysis = asyncio.run(analyzer.analyze_full(sample_jd, "technology"))
+    analysis = full_analysis["analysis"]
     
     print("Analysis Results:")
     print(json.dumps(analysis, indent=2))
@@ -577,11 +828,10 @@ def test_job_analyzer():
     print("Matching Criteria:")
     print(json.dumps(criteria, indent=2))
     
-    # Extract company insights
-    print("\nExtracting company insights...")
-    insights = analyzer.extract_company_insights(sample_jd)
+    # Company insights were extracted alongside the analysis
+    insights = full_analysis["company_insights"]
     
-    print("Company Insights:")
+    print("\nCompany Insights:")
     print(json.dumps(insights, indent=2))
 
 